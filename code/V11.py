@@ -6,11 +6,117 @@ import csv
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QStackedWidget, QWidget, QVBoxLayout,
     QHBoxLayout, QPushButton, QSlider, QLabel, QGraphicsView,
-    QGraphicsScene, QTableWidget, QTableWidgetItem, QLineEdit,
+    QGraphicsScene, QGraphicsPixmapItem, QTableWidget, QTableWidgetItem, QLineEdit,
     QFileDialog, QMessageBox, QDialog, QSizePolicy
 )
 from PySide6.QtGui import QPixmap, QImage, QTransform, QPainter, QColor, QPen
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QSize, QRect, QObject, QRunnable, QThreadPool
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# 轮廓几何参数计算（周长、面积、质心、圆形度）
+if HAS_NUMBA:
+    @njit(nogil=True, cache=True, fastmath=True)
+    def _contour_stats_kernel(points, offsets):
+        """对拼接后的全部轮廓点一次性计算周长（线段长度和）、面积（鞋带公式）及质心"""
+        n = offsets.shape[0] - 1
+        perimeters = np.zeros(n)
+        areas = np.zeros(n)
+        cxs = np.zeros(n)
+        cys = np.zeros(n)
+        circularities = np.zeros(n)
+        for k in range(n):
+            start = offsets[k]
+            end = offsets[k + 1]
+            perimeter = 0.0
+            area2 = 0.0
+            sx = 0.0
+            sy = 0.0
+            for i in range(start, end):
+                j = i + 1 if i + 1 < end else start
+                x0 = points[i, 0]
+                y0 = points[i, 1]
+                x1 = points[j, 0]
+                y1 = points[j, 1]
+                dx = x1 - x0
+                dy = y1 - y0
+                perimeter += np.sqrt(dx * dx + dy * dy)
+                cross = x0 * y1 - x1 * y0
+                area2 += cross
+                sx += (x0 + x1) * cross
+                sy += (y0 + y1) * cross
+            perimeters[k] = perimeter
+            areas[k] = abs(area2) * 0.5
+            if area2 != 0.0:
+                cxs[k] = sx / (3.0 * area2)
+                cys[k] = sy / (3.0 * area2)
+            if perimeter > 0.0:
+                circularities[k] = 4.0 * np.pi * areas[k] / (perimeter * perimeter)
+        return perimeters, areas, cxs, cys, circularities
+
+
+def compute_contour_stats(contours):
+    """返回各轮廓的周长、面积、质心X、质心Y及圆形度数组"""
+    count = len(contours)
+    if HAS_NUMBA and count > 0:
+        points = np.concatenate([c.reshape(-1, 2) for c in contours]).astype(np.float64)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in contours], out=offsets[1:])
+        return _contour_stats_kernel(points, offsets)
+    
+    # 未安装numba时回退到OpenCV逐轮廓计算
+    perimeters = np.zeros(count)
+    areas = np.zeros(count)
+    cxs = np.zeros(count)
+    cys = np.zeros(count)
+    for k, contour in enumerate(contours):
+        perimeters[k] = cv2.arcLength(contour, True)
+        areas[k] = cv2.contourArea(contour)
+        M = cv2.moments(contour)
+        if M["m00"] > 0:
+            cxs[k] = M["m10"] / M["m00"]
+            cys[k] = M["m01"] / M["m00"]
+    circularities = np.zeros(count)
+    np.divide(4 * np.pi * areas, perimeters ** 2, out=circularities, where=perimeters > 0)
+    return perimeters, areas, cxs, cys, circularities
+
+
+def warmup_contour_stats():
+    """预先编译numba内核，避免首次分析时的编译延迟"""
+    square = np.array([[[0, 0]], [[0, 1]], [[1, 1]], [[1, 0]]], dtype=np.int32)
+    compute_contour_stats([square])
+
+
+# 后台轮廓提取与参数计算任务（避免阻塞界面线程）
+class ContourWorkerSignals(QObject):
+    finished = Signal(object, object)
+    failed = Signal(str)
+
+
+class ContourWorker(QRunnable):
+    def __init__(self, binary_image):
+        super().__init__()
+        self.binary_image = binary_image
+        self.signals = ContourWorkerSignals()
+
+    def run(self):
+        try:
+            # OpenCV 3.2+ 的findContours不再修改输入图像，无需拷贝
+            contours, _ = cv2.findContours(
+                self.binary_image, cv2.RETR_EXTERNAL,
+                cv2.CHAIN_APPROX_SIMPLE
+            )
+            contours = list(contours)
+            stats = compute_contour_stats(contours)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(contours, stats)
 
 # 自定义可缩放图像视图类（完整显示整张图片+实时更新）
 class ZoomableGraphicsView(QGraphicsView):
@@ -21,11 +127,19 @@ class ZoomableGraphicsView(QGraphicsView):
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
         
+        # 持久化的像素图项，更新图像时仅替换像素图，不重建场景
+        self._pix_item = QGraphicsPixmapItem()
+        self.scene().addItem(self._pix_item)
+        
         # 缩放参数
         self.zoom_factor = 1.0
         self.min_zoom = 0.1
         self.max_zoom = 10.0
         self.zoom_step = 0.1
+        
+        # 图像缓冲区与当前图像尺寸
+        self._buf = None
+        self._image_size = None
 
     def wheelEvent(self, event):
         """滚轮事件实现图像缩放"""
@@ -44,39 +158,42 @@ class ZoomableGraphicsView(QGraphicsView):
         
         event.accept()
 
-    def set_image(self, cv_image):
-        """完整显示整张图像，实时更新无裁剪"""
-        self.scene().clear()
+    def set_image(self, cv_image, fit=True):
+        """完整显示整张图像，实时更新无裁剪（fit=False时仅在尺寸变化时重新适配视图）"""
         if cv_image is None:
+            self._buf = None
+            self._pix_item.setPixmap(QPixmap())
             return
         
-        # 处理灰度图像（转为3通道BGR，确保显示逻辑统一）
-        if len(cv_image.shape) == 2:
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_GRAY2BGR)
-        
-        # 转换OpenCV图像（BGR）到Qt图像（RGB）
-        height, width, channel = cv_image.shape
-        bytes_per_line = 3 * width
+        # 直接按原生格式包装OpenCV图像缓冲区（灰度图为Grayscale8，彩色图为BGR888）
+        # 保留连续内存数组的引用，防止Qt拷贝前ndarray被释放
+        self._buf = np.ascontiguousarray(cv_image)
+        height, width = self._buf.shape[:2]
+        if self._buf.ndim == 2:
+            image_format = QImage.Format.Format_Grayscale8
+        else:
+            image_format = QImage.Format.Format_BGR888
         q_image = QImage(
-            cv_image.data, width, height, bytes_per_line,
-            QImage.Format.Format_RGB888
+            self._buf.data, width, height, self._buf.strides[0], image_format
         )
         
-        # 创建像素图并添加到场景（确保完整加载整张图片）
-        pixmap = QPixmap.fromImage(q_image)
-        self.scene().addPixmap(pixmap)
+        # 创建像素图并更新到场景（确保完整加载整张图片）
+        pixmap = QPixmap.fromImage(q_image, Qt.ImageConversionFlag.NoFormatConversion)
+        self._pix_item.setPixmap(pixmap)
         self.scene().setSceneRect(pixmap.rect())
         
-        # 自适应视图：自动缩放图像以适配视图，同时保留完整内容
-        self.fitInView(self.scene().sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
-        self.zoom_factor = 1.0
+        # 载入新图像时自适应视图；阈值刷新（fit=False）仅在尺寸变化时重新缩放
+        if fit or pixmap.size() != self._image_size:
+            self._image_size = pixmap.size()
+            self.fitInView(self.scene().sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+            self.zoom_factor = 1.0
 
     def reset_transform(self):
         """重置图像变换，恢复整张图片显示"""
         self.setTransform(QTransform())
         self.fitInView(self.scene().sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
 
-# 剪裁对话框类（无改动）
+# 剪裁对话框类
 class ImageCropDialog(QDialog):
     crop_completed = Signal(np.ndarray)
 
@@ -98,6 +215,10 @@ class ImageCropDialog(QDialog):
         self.crop_bottom = 0
 
         self.scaled_qt_img = None
+        self._scaled_rgb = None
+        self._scaled_label_size = QSize()
+        self._overlay = None
+        self._last_rect = None
         self.scale_w = 1.0
         self.scale_h = 1.0
         self.img_offset_x = 0
@@ -125,6 +246,7 @@ class ImageCropDialog(QDialog):
         self.image_label.mousePressEvent = self.on_mouse_press
         self.image_label.mouseMoveEvent = self.on_mouse_move
         self.image_label.mouseReleaseEvent = self.on_mouse_release
+        self.image_label.resizeEvent = self.on_label_resize
         self.showEvent = self.on_show_event
 
     def on_show_event(self, event):
@@ -135,20 +257,41 @@ class ImageCropDialog(QDialog):
             self._update_mouse_cursor(self._judge_drag_type(dummy_x, dummy_y))
         event.accept()
 
+    def on_label_resize(self, event):
+        # 仅在显示区域尺寸变化时重新缩放图像
+        if self.scaled_qt_img is not None and event.size() != self._scaled_label_size:
+            self._init_image_display()
+        event.accept()
+
+    def _scale_image(self, label_size):
+        """使用cv2.resize将原图缩放至显示区域（保持宽高比），并缓存缩放结果"""
+        h, w = self.original_image.shape[:2]
+        ratio = min(label_size.width() / w, label_size.height() / h)
+        target_w = max(1, int(round(w * ratio)))
+        target_h = max(1, int(round(h * ratio)))
+        scaled = cv2.resize(self.original_image, (target_w, target_h), interpolation=cv2.INTER_AREA)
+        self._scaled_rgb = cv2.cvtColor(scaled, cv2.COLOR_BGR2RGB)
+        self.scaled_qt_img = QImage(
+            self._scaled_rgb.data, target_w, target_h, self._scaled_rgb.strides[0], QImage.Format_RGB888
+        )
+        self._scaled_label_size = QSize(label_size)
+
+        # 剪裁遮罩绘制用的持久化图像缓冲区
+        self._overlay = self.scaled_qt_img.copy()
+        self._last_rect = None
+
+        self.scale_w = w / target_w
+        self.scale_h = h / target_h
+        self.img_offset_x = (label_size.width() - target_w) // 2
+        self.img_offset_y = (label_size.height() - target_h) // 2
+
     def _init_image_display(self):
         if self.original_image is None:
             return
 
-        rgb_img = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_img.shape
-        qt_img = QImage(rgb_img.data, w, h, ch * w, QImage.Format_RGB888)
-        self.scaled_qt_img = qt_img.scaled(self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.image_label.setPixmap(QPixmap.fromImage(self.scaled_qt_img))
-
-        self.scale_w = w / self.scaled_qt_img.width()
-        self.scale_h = h / self.scaled_qt_img.height()
-        self.img_offset_x = (self.image_label.width() - self.scaled_qt_img.width()) // 2
-        self.img_offset_y = (self.image_label.height() - self.scaled_qt_img.height()) // 2
+        label_size = self.image_label.size()
+        if self.scaled_qt_img is None or label_size != self._scaled_label_size:
+            self._scale_image(label_size)
 
         img_w, img_h = self.scaled_qt_img.width(), self.scaled_qt_img.height()
         self.crop_left = 20
@@ -197,22 +340,39 @@ class ImageCropDialog(QDialog):
     def _draw_crop_rect(self):
         if self.scaled_qt_img is None:
             return
-        draw_img = self.scaled_qt_img.copy()
-        painter = QPainter(draw_img)
-
+        rect = (self.crop_left, self.crop_top, self.crop_right, self.crop_bottom)
+        if rect == self._last_rect:
+            return
+        img_w, img_h = self._overlay.width(), self._overlay.height()
+        painter = QPainter(self._overlay)
+
+        # 用原图恢复上一次绘制的阴影及边框区域（边框线宽4，向内外各扩展）
+        if self._last_rect is not None:
+            l, t, r, b = self._last_rect
+            m = 3
+            for src_rect in (
+                QRect(0, 0, img_w, t + m),
+                QRect(0, b - m, img_w, img_h - b + m),
+                QRect(0, t, l + m, b - t),
+                QRect(r - m, t, img_w - r + m, b - t),
+            ):
+                painter.drawImage(src_rect, self.scaled_qt_img, src_rect)
+
+        l, t, r, b = rect
         painter.setBrush(QColor(0, 0, 0, 80))
         painter.setPen(Qt.NoPen)
-        painter.drawRect(0, 0, draw_img.width(), self.crop_top)
-        painter.drawRect(0, self.crop_bottom, draw_img.width(), draw_img.height() - self.crop_bottom)
-        painter.drawRect(0, self.crop_top, self.crop_left, self.crop_bottom - self.crop_top)
-        painter.drawRect(self.crop_right, self.crop_top, draw_img.width() - self.crop_right, self.crop_bottom - self.crop_top)
+        painter.drawRect(0, 0, img_w, t)
+        painter.drawRect(0, b, img_w, img_h - b)
+        painter.drawRect(0, t, l, b - t)
+        painter.drawRect(r, t, img_w - r, b - t)
 
         painter.setPen(QPen(Qt.red, 4, Qt.SolidLine))
         painter.setBrush(Qt.NoBrush)
-        painter.drawRect(self.crop_left, self.crop_top, self.crop_right - self.crop_left, self.crop_bottom - self.crop_top)
+        painter.drawRect(l, t, r - l, b - t)
         painter.end()
 
-        self.image_label.setPixmap(QPixmap.fromImage(draw_img))
+        self._last_rect = rect
+        self.image_label.setPixmap(QPixmap.fromImage(self._overlay))
 
     def _update_mouse_cursor(self, drag_type):
         if drag_type in ["left", "right"]:
@@ -289,9 +449,26 @@ class CircularityCalculator(QMainWindow):
         self.gray_image = None
         self.binary_image = None
         self.processed_image = None
-        self.particle_data = []
+        self._contours = []
+        self._contour_worker = None
+        # 颗粒数据（结构数组形式：每项参数一个数组）
+        self.particle_indices = np.empty(0, dtype=np.int32)
+        self.perimeters = np.empty(0)
+        self.areas = np.empty(0)
+        self.circularities = np.empty(0)
+        self.cX = np.empty(0, dtype=np.int32)
+        self.cY = np.empty(0, dtype=np.int32)
+        self.labels = []
+        self.filtered_rows = None
         self.current_threshold = 160
         
+        # 阈值滑块合并定时器：拖动时按固定间隔处理最新的阈值
+        self._thresh_timer = QTimer(self)
+        self._thresh_timer.setSingleShot(True)
+        self._thresh_timer.timeout.connect(self._apply_threshold)
+        # 当前预览所对应的阈值（None表示预览尚未显示二值图），阈值未变时跳过重建
+        self._applied_threshold = None
+        
         # 创建堆叠窗口
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
@@ -350,6 +527,8 @@ class CircularityCalculator(QMainWindow):
         threshold_layout.addWidget(threshold_label)
         threshold_layout.addWidget(self.threshold_slider)
         threshold_layout.addWidget(self.threshold_value_label)
+        self.otsu_btn = QPushButton("自动阈值(Otsu)")
+        threshold_layout.addWidget(self.otsu_btn)
         main_layout.addLayout(threshold_layout)
         
         # 按钮区域
@@ -369,6 +548,7 @@ class CircularityCalculator(QMainWindow):
         self.upload_btn.clicked.connect(self.upload_image)
         self.crop_btn.clicked.connect(self.open_crop_dialog)
         self.threshold_slider.valueChanged.connect(self.update_threshold)
+        self.otsu_btn.clicked.connect(self.auto_threshold)
         
         return widget
 
@@ -440,7 +620,7 @@ class CircularityCalculator(QMainWindow):
         
         return widget
 
-    # 页面功能函数（保持不变）
+    # 页面功能函数
     def upload_image(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self, "选择图像文件", "", 
@@ -452,10 +632,18 @@ class CircularityCalculator(QMainWindow):
         self.original_image = cv2.imread(file_path)
         self.cropped_image = None
         if self.original_image is None:
+            # 清除上一张图像的处理数据，避免在无效图像上继续调整阈值或分析
+            self.gray_image = None
+            self.binary_image = None
+            self._applied_threshold = None
+            self.crop_btn.setEnabled(False)
+            self.next1_btn.setEnabled(False)
             QMessageBox.warning(self, "错误", "无法读取选中的图像文件！")
             return
         self.view1.set_image(self.original_image)
+        self._applied_threshold = None
         self.gray_image = cv2.cvtColor(self.original_image, cv2.COLOR_BGR2GRAY)
+        self.binary_image = np.empty_like(self.gray_image)
         self.update_binary_image(self.current_threshold)
         self.crop_btn.setEnabled(True)
         self.next1_btn.setEnabled(True)
@@ -471,75 +659,146 @@ class CircularityCalculator(QMainWindow):
     def on_crop_completed(self, cropped_img):
         self.cropped_image = cropped_img
         self.gray_image = cv2.cvtColor(self.cropped_image, cv2.COLOR_BGR2GRAY)
+        self.binary_image = np.empty_like(self.gray_image)
         self.update_binary_image(self.current_threshold)
         self.view1.set_image(self.binary_image)
+        self._applied_threshold = self.current_threshold
         self.next1_btn.setEnabled(True)
 
     def update_threshold(self, value):
         self.current_threshold = value
         self.threshold_value_label.setText(str(value))
-        target_image = self.cropped_image if self.cropped_image is not None else self.original_image
-        if target_image is not None:
-            self.gray_image = cv2.cvtColor(target_image, cv2.COLOR_BGR2GRAY)
-            self.update_binary_image(value)
-            self.view1.set_image(self.binary_image)
-            self.next1_btn.setEnabled(True)
+        # 定时器空闲时才启动，拖动过程中约每16ms刷新一次最新阈值
+        if not self._thresh_timer.isActive():
+            self._thresh_timer.start(16)
+
+    def _apply_threshold(self):
+        # 灰度图在上传/剪裁时已计算，这里只需重新二值化；阈值未变化时预览已是最新
+        if self.gray_image is None or self.current_threshold == self._applied_threshold:
+            return
+        self.update_binary_image(self.current_threshold)
+        self.view1.set_image(self.binary_image, fit=False)
+        self._applied_threshold = self.current_threshold
+        self.next1_btn.setEnabled(True)
+
+    def auto_threshold(self):
+        """使用Otsu算法一次性计算最佳阈值，并同步到滑块"""
+        if self.gray_image is None:
+            QMessageBox.warning(self, "错误", "请先上传图像！")
+            return
+        self._thresh_timer.stop()
+        ret, _ = cv2.threshold(
+            self.gray_image, 0, 255,
+            cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU, dst=self.binary_image
+        )
+        self.current_threshold = int(ret)
+        # 二值图已由Otsu计算完成，更新滑块时不再重复触发阈值处理
+        self.threshold_slider.blockSignals(True)
+        self.threshold_slider.setValue(self.current_threshold)
+        self.threshold_slider.blockSignals(False)
+        self.threshold_value_label.setText(str(self.current_threshold))
+        self.view1.set_image(self.binary_image, fit=False)
+        self._applied_threshold = self.current_threshold
+        self.next1_btn.setEnabled(True)
 
     def update_binary_image(self, threshold):
         if self.gray_image is None:
             return
-        _, self.binary_image = cv2.threshold(
-            self.gray_image, threshold, 255, 
-            cv2.THRESH_BINARY_INV
+        # 直接写入预分配的二值图缓冲区，避免每次调整阈值重新分配内存
+        cv2.threshold(
+            self.gray_image, threshold, 255,
+            cv2.THRESH_BINARY_INV, dst=self.binary_image
         )
 
     def goto_page2(self):
         if self.binary_image is None:
             QMessageBox.warning(self, "错误", "请先完成图像上传和阈值调整！")
             return
-        contours, _ = cv2.findContours(
-            self.binary_image.copy(), cv2.RETR_EXTERNAL, 
-            cv2.CHAIN_APPROX_SIMPLE
-        )
-        self.particle_data = []
+        # 先应用尚未处理的阈值调整，确保分析的是当前显示的阈值，且计算期间不会再改写二值图
+        if self._thresh_timer.isActive():
+            self._thresh_timer.stop()
+            self._apply_threshold()
+        # 在线程池中计算，计算期间禁用页面1的操作，防止二值图被修改
+        self.page1.setEnabled(False)
+        self.statusBar().showMessage("正在分析颗粒，请稍候……")
+        self._contour_worker = ContourWorker(self.binary_image)
+        self._contour_worker.signals.finished.connect(self.on_contours_ready)
+        self._contour_worker.signals.failed.connect(self.on_contours_failed)
+        QThreadPool.globalInstance().start(self._contour_worker)
+
+    def on_contours_failed(self, message):
+        self._contour_worker = None
+        self.page1.setEnabled(True)
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "错误", f"颗粒分析失败：\n{message}")
+
+    def on_contours_ready(self, contours, stats):
+        self._contour_worker = None
+        self.page1.setEnabled(True)
+        self.statusBar().clearMessage()
+        
+        # 缓存轮廓及颗粒参数，供过滤步骤直接复用
+        self._contours = contours
         target_original = self.cropped_image if self.cropped_image is not None else self.original_image
         self.processed_image = target_original.copy()
-        for idx, contour in enumerate(contours, 1):
-            perimeter = cv2.arcLength(contour, closed=True)
-            area = cv2.contourArea(contour)
-            if perimeter <= 0 or area <= 0:
-                continue
-            circularity = (4 * np.pi * area) / (perimeter ** 2)
-            self.particle_data.append({
-                "index": idx,
-                "perimeter": round(perimeter, 4),
-                "area": round(area, 4),
-                "circularity": round(circularity, 4)
-            })
-            cv2.drawContours(self.processed_image, [contour], 0, (0, 255, 0), 3)
-            M = cv2.moments(contour)
-            if M["m00"] > 0:
-                cX = int(M["m10"] / M["m00"])
-                cY = int(M["m01"] / M["m00"])
-                text = f"C:{round(circularity,4)} A:{round(area,4)} L:{round(perimeter,4)}"
-                cv2.putText(
-                    self.processed_image, text, (cX, cY),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2
-                )
-        self.view2.set_image(cv2.cvtColor(self.processed_image, cv2.COLOR_BGR2RGB))
-        self.fill_table(self.particle_data)
+        
+        perimeters, areas, cxs, cys, circularities = stats
+        valid_idx = np.flatnonzero((perimeters > 0) & (areas > 0))
+        
+        self.particle_indices = (valid_idx + 1).astype(np.int32)
+        # 保留全精度数值，仅在显示和导出时格式化为4位小数
+        self.perimeters = perimeters[valid_idx]
+        self.areas = areas[valid_idx]
+        self.circularities = circularities[valid_idx]
+        self.cX = cxs[valid_idx].astype(np.int32)
+        self.cY = cys[valid_idx].astype(np.int32)
+        # 预先生成标注文本，过滤步骤直接复用
+        self.labels = [
+            "C:%.4f A:%.4f L:%.4f" % (c, a, p)
+            for p, a, c in zip(
+                self.perimeters.tolist(), self.areas.tolist(), self.circularities.tolist()
+            )
+        ]
+        self.filtered_rows = None
+        
+        all_rows = np.arange(len(valid_idx))
+        self.draw_particles(all_rows)
+        self.view2.set_image(self.processed_image)
+        self.fill_table(all_rows)
         self.stacked_widget.setCurrentIndex(1)
 
-    def fill_table(self, data):
-        self.table.setRowCount(len(data))
-        for row, item in enumerate(data):
-            self.table.setItem(row, 0, QTableWidgetItem(str(item["index"])))
-            self.table.setItem(row, 1, QTableWidgetItem(str(item["perimeter"])))
-            self.table.setItem(row, 2, QTableWidgetItem(str(item["area"])))
-            self.table.setItem(row, 3, QTableWidgetItem(str(item["circularity"])))
-        self.table.horizontalHeader().setStretchLastSection(True)
-        for col in range(4):
-            self.table.resizeColumnToContents(col)
+    def draw_particles(self, rows):
+        """在处理图像上绘制指定行颗粒的轮廓及参数标注（使用缓存的轮廓）"""
+        # 一次性绘制全部轮廓，参数标注仍需逐个绘制
+        kept = [self._contours[idx - 1] for idx in self.particle_indices[rows].tolist()]
+        if kept:
+            cv2.drawContours(self.processed_image, kept, -1, (0, 255, 0), 3)
+        for row, cX, cY in zip(rows.tolist(), self.cX[rows].tolist(), self.cY[rows].tolist()):
+            cv2.putText(
+                self.processed_image, self.labels[row], (cX, cY),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2
+            )
+
+    def fill_table(self, rows):
+        # 批量填充表格：暂停刷新与信号，填充完成后统一重绘
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(len(rows))
+            for row, (idx, perimeter, area, circularity) in enumerate(zip(
+                self.particle_indices[rows].tolist(), self.perimeters[rows].tolist(),
+                self.areas[rows].tolist(), self.circularities[rows].tolist()
+            )):
+                self.table.setItem(row, 0, QTableWidgetItem(str(idx)))
+                self.table.setItem(row, 1, QTableWidgetItem(f"{perimeter:.4f}"))
+                self.table.setItem(row, 2, QTableWidgetItem(f"{area:.4f}"))
+                self.table.setItem(row, 3, QTableWidgetItem(f"{circularity:.4f}"))
+            self.table.horizontalHeader().setStretchLastSection(True)
+            for col in range(4):
+                self.table.resizeColumnToContents(col)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
 
     def filter_particles(self):
         try:
@@ -549,25 +808,14 @@ class CircularityCalculator(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, "错误", "请输入有效的非负数字作为最小面积阈值！")
             return
-        filtered_data = [item for item in self.particle_data if item["area"] >= min_area]
+        # 直接按缓存的轮廓面积过滤（与表格中的面积定义一致，无需重新标记连通域）
+        filtered_rows = np.flatnonzero(self.areas >= min_area)
         target_original = self.cropped_image if self.cropped_image is not None else self.original_image
         self.processed_image = target_original.copy()
-        contours, _ = cv2.findContours(self.binary_image.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        filtered_contours = [contour for contour in contours if cv2.contourArea(contour) >= min_area]
-        for contour in filtered_contours:
-            cv2.drawContours(self.processed_image, [contour], 0, (0, 255, 0), 3)
-            perimeter = cv2.arcLength(contour, closed=True)
-            area = cv2.contourArea(contour)
-            circularity = (4 * np.pi * area) / (perimeter ** 2) if perimeter > 0 else 0
-            M = cv2.moments(contour)
-            if M["m00"] > 0:
-                cX = int(M["m10"] / M["m00"])
-                cY = int(M["m01"] / M["m00"])
-                text = f"C:{round(circularity,4)} A:{round(area,4)} L:{round(perimeter,4)}"
-                cv2.putText(self.processed_image, text, (cX, cY), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-        self.fill_table(filtered_data)
-        self.view3.set_image(cv2.cvtColor(self.processed_image, cv2.COLOR_BGR2RGB))
-        self.filtered_particle_data = filtered_data
+        self.draw_particles(filtered_rows)
+        self.fill_table(filtered_rows)
+        self.view3.set_image(self.processed_image)
+        self.filtered_rows = filtered_rows
         self.stacked_widget.setCurrentIndex(2)
 
     def save_processed_image(self):
@@ -587,7 +835,7 @@ class CircularityCalculator(QMainWindow):
         QMessageBox.information(self, "成功", f"图像已保存至：\n{save_path}")
 
     def save_processed_csv(self):
-        if not self.original_image_path or not hasattr(self, "filtered_particle_data"):
+        if not self.original_image_path or self.filtered_rows is None:
             QMessageBox.warning(self, "错误", "没有可保存的颗粒数据！")
             return
         dir_name, file_name = os.path.split(self.original_image_path)
@@ -602,10 +850,11 @@ class CircularityCalculator(QMainWindow):
         with open(save_path, "w", newline="", encoding="utf-8-sig") as csv_file:
             writer = csv.writer(csv_file)
             writer.writerow(["序号", "周长", "面积", "圆形度"])
-            for item in self.filtered_particle_data:
-                writer.writerow([
-                    item["index"], item["perimeter"], item["area"], item["circularity"]
-                ])
+            rows = self.filtered_rows
+            writer.writerows(zip(
+                self.particle_indices[rows].tolist(), np.round(self.perimeters[rows], 4).tolist(),
+                np.round(self.areas[rows], 4).tolist(), np.round(self.circularities[rows], 4).tolist()
+            ))
         QMessageBox.information(self, "成功", f"CSV数据已保存至：\n{save_path}")
 
 if __name__ == "__main__":
@@ -614,6 +863,7 @@ if __name__ == "__main__":
     )
     
     app = QApplication(sys.argv)
+    warmup_contour_stats()
     window = CircularityCalculator()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file